@@ -4,6 +4,7 @@ from dataclasses import asdict
 import traceback
 
 from src.core.dependencies import get_hand_repository, get_poker_service
+from src.core.replay_pool import ReplayPoolSaturated
 from src.models.hand import Hand, HandCreate, Player
 from src.repository.hand_repository import HandRepository
 from src.services.poker_service import PokerService
@@ -13,6 +14,7 @@ router = APIRouter(prefix="/hands", tags=["Hands"])
 @router.post("/", response_model=Hand, status_code=status.HTTP_201_CREATED)
 def create_hand(
     hand_request: HandCreate,
+    # Resolved in order: replay admission happens before a DB connection is taken.
     poker_service: PokerService = Depends(get_poker_service),
     repo: HandRepository = Depends(get_hand_repository)
 ):
@@ -39,6 +41,9 @@ def create_hand(
         repo.create(new_hand)
         
         return new_hand
+    except ReplayPoolSaturated:
+        # Turned into a 503 with Retry-After by the app's exception handler.
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, 
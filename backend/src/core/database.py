@@ -10,12 +10,16 @@ def get_db_url() -> str:
     
     return f"dbname='{os.getenv('DB_NAME', 'poker')}' user='{os.getenv('DB_USER', 'poker')}' password='{os.getenv('DB_PASSWORD', 'poker')}' host='{host}' port='{os.getenv('DB_PORT', '5432')}'"
 
+def get_db_pool_size() -> int:
+    """Maximum number of connections in the database pool."""
+    return int(os.getenv("DB_POOL_MAX", "10"))
+
 def startup_db_client():
     """Initializes the database connection pool."""
     global db_pool
     db_url = get_db_url()
     print(f"Initializing database connection pool for host: {os.getenv('DB_HOST', 'localhost')}...")
-    db_pool = SimpleConnectionPool(minconn=1, maxconn=10, dsn=db_url)
+    db_pool = SimpleConnectionPool(minconn=1, maxconn=get_db_pool_size(), dsn=db_url)
 
 def shutdown_db_client():
     """Closes all connections in the pool."""
@@ -1,9 +1,11 @@
+from typing import AsyncIterator
 from fastapi import Depends
 from psycopg2.extensions import connection
 
 from src.repository.hand_repository import HandRepository
 from src.services.poker_service import PokerService
 from src.core.database import get_db
+from src.core.replay_pool import PooledPokerService, admit_replay, is_replay_pool_running
 
 def get_hand_repository(conn: connection = Depends(get_db)) -> HandRepository:
     """
@@ -12,6 +14,20 @@ def get_hand_repository(conn: connection = Depends(get_db)) -> HandRepository:
     """
     return HandRepository(conn)
 
-def get_poker_service() -> PokerService:
-    """Dependency provider for the PokerService."""
-    return PokerService()
+async def get_poker_service() -> AsyncIterator[PokerService]:
+    """
+    Dependency provider for the PokerService.
+    Replays run on the worker process pool when it is running. Admission is
+    taken here, on the event loop, so rejected requests never occupy a thread
+    or a DB connection; declare this dependency before get_hand_repository.
+    """
+    if not is_replay_pool_running():
+        yield PokerService()
+        return
+
+    slot = admit_replay()
+    try:
+        yield PooledPokerService(slot)
+    finally:
+        if not slot.submitted:
+            slot.release()
@@ -0,0 +1,265 @@
+import os
+import time
+import threading
+import multiprocessing
+import anyio.to_thread
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional
+
+from src.core.database import get_db_pool_size
+from src.core.warmup import process_stats, warm_up_poker_service
+from src.services.poker_service import PokerService
+
+replay_pool = None
+replay_slots = None
+replay_worker_stats: List[Dict[str, Any]] = []
+
+_rebuild_lock = threading.Lock()
+_rebuilding = False
+
+_worker_service = None
+_worker_stats = None
+_worker_barrier = None
+
+# Imported once by the forkserver; pool workers fork from it and share those pages.
+_FORKSERVER_PRELOAD = ["pokerkit", "src.services.poker_service", "src.core.replay_pool"]
+
+def get_replay_workers() -> int:
+    """
+    Number of worker processes used for hand replays (0 runs them in-process).
+    Defaults to the cores split across uvicorn's worker processes (WEB_CONCURRENCY).
+    """
+    web_workers = max(int(os.getenv("WEB_CONCURRENCY", "1")), 1)
+    default = max((os.cpu_count() or 1) // web_workers, 1)
+    return int(os.getenv("REPLAY_WORKERS", default))
+
+def _get_threadpool_size() -> int:
+    """Size of the threadpool sync endpoints and dependencies run on."""
+    try:
+        return int(anyio.to_thread.current_default_thread_limiter().total_tokens)
+    except RuntimeError:
+        # Outside an event loop; anyio's default.
+        return 40
+
+def get_replay_max_in_flight() -> int:
+    """
+    Maximum number of replays queued or running before new ones are rejected.
+    The default leaves one DB connection and one thread for other requests,
+    since every admitted replay holds both while it waits.
+    """
+    default = min(
+        2 * max(get_replay_workers(), 1),
+        get_db_pool_size() - 1,
+        _get_threadpool_size() - 1,
+    )
+    return int(os.getenv("REPLAY_MAX_IN_FLIGHT", max(default, 1)))
+
+def get_replay_timeout() -> float:
+    """Seconds a request waits for its replay before giving up."""
+    return float(os.getenv("REPLAY_TIMEOUT", "10"))
+
+def get_replay_startup_timeout() -> float:
+    """Seconds to wait for every worker of a new pool to check in."""
+    return float(os.getenv("REPLAY_STARTUP_TIMEOUT", "60"))
+
+def get_replay_retry_after() -> int:
+    """Value of the Retry-After header sent when the pool is saturated."""
+    return int(os.getenv("REPLAY_RETRY_AFTER", "1"))
+
+class ReplaySlot:
+    """
+    One admission to the replay pool. Released exactly once: when its replay
+    finishes, or by the caller if it never submits one.
+    """
+
+    def __init__(self, slots: threading.BoundedSemaphore):
+        self._slots = slots
+        self._lock = threading.Lock()
+        self._released = False
+        self.submitted = False
+
+    def release(self) -> None:
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        self._slots.release()
+
+class ReplayPoolSaturated(Exception):
+    """Raised when a replay cannot be admitted, does not finish in time, or the pool is restarting."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+# ------------- worker side -------------
+
+def _init_worker(barrier) -> None:
+    """
+    Runs once per worker process: primes the service with a warmup replay
+    and records the worker's startup stats for its check-in.
+    """
+    global _worker_service, _worker_stats, _worker_barrier
+    # Only used where /proc is unavailable; pokerkit was imported by the forkserver.
+    started_at = time.perf_counter()
+    _worker_barrier = barrier
+    _worker_service = PokerService()
+    warmup_seconds = warm_up_poker_service(_worker_service)
+    _worker_stats = process_stats(started_at)
+    _worker_stats["warmup_seconds"] = round(warmup_seconds, 3)
+
+def _check_in(timeout: float) -> Dict[str, Any]:
+    """
+    Blocks until every worker of the pool is inside a check-in, so no worker
+    can take two of them, then returns this worker's startup stats.
+    """
+    _worker_barrier.wait(timeout)
+    return _worker_stats
+
+def _score_in_worker(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Replays a hand inside a worker process."""
+    return _worker_service.validate_and_score(payload)
+
+# ------------- lifecycle -------------
+
+def _start_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Creates a process pool and blocks until each of its workers has checked in.
+    The check-ins' stats are stored in `replay_worker_stats`.
+    """
+    global replay_worker_stats
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(_FORKSERVER_PRELOAD)
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=ctx,
+        initializer=_init_worker,
+        initargs=(ctx.Barrier(workers),),
+    )
+    timeout = get_replay_startup_timeout()
+    try:
+        # Check-ins wait on each other, so none finishes (and frees its worker
+        # for another) until there is one running in every worker.
+        check_ins = [pool.submit(_check_in, timeout) for _ in range(workers)]
+        stats = [future.result(timeout=timeout) for future in check_ins]
+    except BaseException:
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+
+    for worker in stats:
+        print(
+            f"Replay worker {worker['pid']} ready in {worker['startup_seconds']}s "
+            f"(warmup {worker['warmup_seconds']}s, rss {worker['rss_kb']} KiB, pss {worker['pss_kb']} KiB)"
+        )
+    replay_worker_stats = stats
+    return pool
+
+def startup_replay_pool():
+    """Starts the replay process pool and waits until every worker is up."""
+    global replay_pool, replay_slots
+    workers = get_replay_workers()
+    if workers <= 0:
+        print("Replay pool disabled; hands will be replayed in-process.")
+        return
+
+    replay_slots = threading.BoundedSemaphore(get_replay_max_in_flight())
+    print(f"Starting replay pool with {workers} worker processes...")
+    replay_pool = _start_pool(workers)
+
+def shutdown_replay_pool():
+    """Shuts down the replay process pool."""
+    global replay_pool, replay_slots
+    with _rebuild_lock:
+        pool, replay_pool = replay_pool, None
+    if pool:
+        print("Shutting down replay pool...")
+        pool.shutdown(wait=True, cancel_futures=True)
+    replay_slots = None
+
+def _rebuild_replay_pool(broken: ProcessPoolExecutor) -> None:
+    """Replaces a broken pool; requests get 503s until the new one is up."""
+    global replay_pool, _rebuilding
+    print("Replay pool is broken, restarting workers...")
+    broken.shutdown(wait=False, cancel_futures=True)
+    try:
+        pool = _start_pool(get_replay_workers())
+    except Exception as e:
+        print(f"Failed to restart replay pool: {e}")
+        pool = None
+
+    with _rebuild_lock:
+        _rebuilding = False
+        if pool is not None and replay_pool is broken:
+            replay_pool, pool = pool, None
+    # Only left over if the app shut down while the new pool was starting.
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def _schedule_rebuild(broken: ProcessPoolExecutor) -> None:
+    """Starts a single background rebuild for a broken pool."""
+    global _rebuilding
+    with _rebuild_lock:
+        if _rebuilding or replay_pool is not broken:
+            return
+        _rebuilding = True
+    threading.Thread(target=_rebuild_replay_pool, args=(broken,), daemon=True).start()
+
+def admit_replay() -> ReplaySlot:
+    """Takes a replay slot without blocking, rejecting the replay if none is free."""
+    slots = replay_slots
+    if slots is None:
+        raise RuntimeError("Replay pool is not initialized.")
+    if not slots.acquire(blocking=False):
+        raise ReplayPoolSaturated("Replay capacity exhausted, please retry later.", get_replay_retry_after())
+    return ReplaySlot(slots)
+
+def submit_replay(payload: Dict[str, Any], slot: Optional[ReplaySlot] = None) -> Dict[str, Any]:
+    """
+    Replays a hand on the process pool using `slot`, or a freshly admitted one.
+    """
+    pool = replay_pool
+    if pool is None:
+        raise RuntimeError("Replay pool is not initialized.")
+    if slot is None:
+        slot = admit_replay()
+
+    retry_after = get_replay_retry_after()
+    try:
+        future = pool.submit(_score_in_worker, payload)
+    except BrokenProcessPool:
+        slot.release()
+        _schedule_rebuild(pool)
+        raise ReplayPoolSaturated("Replay workers are restarting, please retry later.", retry_after)
+    except Exception:
+        slot.release()
+        raise
+    slot.submitted = True
+    # The slot is held until the worker is done, even if the caller stops waiting.
+    future.add_done_callback(lambda _: slot.release())
+
+    try:
+        return future.result(timeout=get_replay_timeout())
+    except FutureTimeoutError:
+        future.cancel()
+        raise ReplayPoolSaturated("Replay timed out, please retry later.", retry_after)
+    except BrokenProcessPool:
+        _schedule_rebuild(pool)
+        raise ReplayPoolSaturated("Replay workers are restarting, please retry later.", retry_after)
+
+class PooledPokerService(PokerService):
+    """
+    PokerService that replays hands on the worker process pool, using the
+    slot it was admitted with, if any, for its first replay.
+    """
+
+    def __init__(self, slot: Optional[ReplaySlot] = None):
+        self._slot = slot
+
+    def validate_and_score(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        slot, self._slot = self._slot, None
+        return submit_replay(payload, slot)
+
+def is_replay_pool_running() -> bool:
+    """Whether replays are currently offloaded to the process pool."""
+    return replay_pool is not None
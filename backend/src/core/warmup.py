@@ -0,0 +1,77 @@
+import os
+import time
+import resource
+from typing import Any, Dict
+
+from src.services.poker_service import PokerService
+
+# A complete 6-handed hand dealt from a single deck (no card appears twice)
+# that reaches a three-way showdown, so a replay touches the state machine,
+# every street and pokerkit's hand evaluation lookups.
+WARMUP_PAYLOAD: Dict[str, Any] = {
+    "players": [
+        {"id": "btn", "name": "BTN", "starting_stack": 1000, "cards": ["Ah", "Kd"], "position": "dealer"},
+        {"id": "sb", "name": "SB", "starting_stack": 1000, "cards": ["Qs", "Jh"], "position": "smallblind"},
+        {"id": "bb", "name": "BB", "starting_stack": 1000, "cards": ["Tc", "Td"], "position": "bigblind"},
+        {"id": "utg", "name": "UTG", "starting_stack": 1000, "cards": ["9h", "9c"], "position": "utg"},
+        {"id": "hj", "name": "HJ", "starting_stack": 1000, "cards": ["8d", "7c"], "position": "hijack"},
+        {"id": "co", "name": "CO", "starting_stack": 1000, "cards": ["6s", "5s"], "position": "cutoff"},
+    ],
+    # UTG raises, BTN and BB call; flop bet is called twice, then checked down.
+    "actions": ["r120", "f", "f", "c", "f", "c", "2c3h4d", "x", "b100", "c", "c", "Js", "x", "x", "x", "2s", "x", "x", "x"],
+    "config": {"sb": 20, "bb": 40, "ante": 0},
+}
+
+def get_rss_kb() -> int:
+    """Returns the resident memory of the current process in KiB."""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, IndexError):
+        # Peak rather than current RSS, but available on every Unix.
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def warm_up_poker_service(service: PokerService) -> float:
+    """Replays the warmup hand once and returns how long it took in seconds."""
+    started = time.perf_counter()
+    service.validate_and_score(WARMUP_PAYLOAD)
+    return time.perf_counter() - started
+
+def get_pss_kb() -> int | None:
+    """
+    Returns the proportional set size in KiB, which splits pages shared with
+    the forkserver and sibling workers; None where /proc is unavailable.
+    """
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+def get_process_age(started_at: float) -> float:
+    """
+    Seconds since the kernel started this process, so everything it imported
+    is included; falls back to time since `started_at` where /proc is unavailable.
+    """
+    try:
+        with open("/proc/self/stat") as f:
+            # Fields after the parenthesised command name; starttime is field 22.
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return time.perf_counter() - started_at
+
+def process_stats(started_at: float) -> Dict[str, Any]:
+    """Startup timing and memory figures for the current process."""
+    return {
+        "pid": os.getpid(),
+        "startup_seconds": round(get_process_age(started_at), 3),
+        "rss_kb": get_rss_kb(),
+        "pss_kb": get_pss_kb(),
+    }
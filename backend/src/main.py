@@ -1,19 +1,54 @@
 import os
-from fastapi import FastAPI
+import time
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from src.api.v1 import hands as hands_router
 from src.core.database import startup_db_client, shutdown_db_client
+from src.core.replay_pool import (
+    PooledPokerService,
+    ReplayPoolSaturated,
+    is_replay_pool_running,
+    startup_replay_pool,
+    shutdown_replay_pool,
+)
+from src.services.poker_service import PokerService
+from src.core.warmup import get_pss_kb, get_rss_kb, process_stats, warm_up_poker_service
+
+startup_stats = {}
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Only used where /proc is unavailable to give the process's real age.
+    started_at = time.perf_counter()
     startup_db_client()
+    startup_replay_pool()
+    # Uvicorn only starts accepting requests, /health included, once this returns.
+    service = PooledPokerService() if is_replay_pool_running() else PokerService()
+    warmup_seconds = warm_up_poker_service(service)
+    startup_stats.update(process_stats(started_at), warmup_seconds=round(warmup_seconds, 3))
+    print(
+        f"Worker {startup_stats['pid']} ready in {startup_stats['startup_seconds']}s "
+        f"(warmup {startup_stats['warmup_seconds']}s, rss {startup_stats['rss_kb']} KiB, "
+        f"pss {startup_stats['pss_kb']} KiB)"
+    )
     yield
+    shutdown_replay_pool()
     shutdown_db_client()
 
 app = FastAPI(lifespan=lifespan)
 
+@app.exception_handler(ReplayPoolSaturated)
+async def replay_pool_saturated_handler(request: Request, exc: ReplayPoolSaturated):
+    """Rejects replays the pool cannot take right now with 503 and Retry-After."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
 cors_origins_str = os.getenv("CORS_ORIGINS", "")
 origins = [origin.strip() for origin in cors_origins_str.split(',') if origin.strip()]
 
@@ -33,4 +68,10 @@ app.include_router(hands_router.router, prefix="/api/v1")
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy"}
+    """Reports the startup snapshot logged at ready time plus current memory use."""
+    return {
+        "status": "healthy",
+        **startup_stats,
+        "current_rss_kb": get_rss_kb(),
+        "current_pss_kb": get_pss_kb(),
+    }
@@ -1,7 +1,11 @@
+import os
 import pytest
 from typing import Generator, List
 from fastapi.testclient import TestClient
 
+# Keep the replay pool small so every TestClient startup stays cheap.
+os.environ.setdefault("REPLAY_WORKERS", "1")
+
 from src.main import app
 from src.core.dependencies import get_hand_repository
 from src.models.hand import Hand
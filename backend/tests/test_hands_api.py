@@ -166,3 +166,14 @@ def test_500_when_repository_fails():
         r = c.post("/api/v1/hands/", json=VALID_HAND_PAYLOAD)
         assert r.status_code == 500
     app.dependency_overrides.clear()
+
+def test_health_reports_startup_stats(client: TestClient):
+    r = client.get("/health")
+    assert r.status_code == 200
+    data = r.json()
+    assert data["status"] == "healthy"
+    assert data["startup_seconds"] >= data["warmup_seconds"] >= 0
+    assert data["rss_kb"] > 0
+    assert data["pss_kb"] > 0
+    assert data["current_rss_kb"] > 0
+    assert data["current_pss_kb"] > 0
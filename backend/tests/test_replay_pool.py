@@ -0,0 +1,124 @@
+import os
+import time
+import signal
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.core import replay_pool
+from src.core.dependencies import get_poker_service, get_hand_repository
+from src.core.replay_pool import ReplayPoolSaturated, PooledPokerService
+from src.services.poker_service import PokerService
+from src.core.warmup import WARMUP_PAYLOAD
+from tests.test_hands_api import VALID_HAND_PAYLOAD
+
+class DummyServiceSaturated:
+    def validate_and_score(self, payload): raise ReplayPoolSaturated("Replay capacity exhausted", 3)
+
+@pytest.fixture
+def pool(monkeypatch):
+    """Starts a single-worker replay pool that admits one replay at a time."""
+    monkeypatch.setenv("REPLAY_WORKERS", "1")
+    monkeypatch.setenv("REPLAY_MAX_IN_FLIGHT", "1")
+    replay_pool.startup_replay_pool()
+    yield replay_pool
+    replay_pool.shutdown_replay_pool()
+
+def test_503_with_retry_after_when_saturated():
+    app.dependency_overrides[get_poker_service] = lambda: DummyServiceSaturated()
+    with TestClient(app) as c:
+        r = c.post("/api/v1/hands/", json=VALID_HAND_PAYLOAD)
+        assert r.status_code == 503
+        assert r.headers["Retry-After"] == "3"
+    app.dependency_overrides.clear()
+
+def test_workers_check_in_with_warmup_stats(pool):
+    [worker] = pool.replay_worker_stats
+    assert worker["pid"] != os.getpid()
+    # Only set once _init_worker has replayed the warmup hand.
+    assert worker["startup_seconds"] >= worker["warmup_seconds"] >= 0
+    assert worker["rss_kb"] > 0
+    assert worker["pss_kb"] > 0
+
+def test_pooled_service_matches_in_process(pool):
+    expected = PokerService().validate_and_score(WARMUP_PAYLOAD)
+    assert PooledPokerService().validate_and_score(WARMUP_PAYLOAD) == expected
+
+def test_pooled_service_propagates_value_error(pool):
+    payload = dict(WARMUP_PAYLOAD, actions=["z"])
+    with pytest.raises(ValueError, match="Unknown player token"):
+        PooledPokerService().validate_and_score(payload)
+
+def test_rejects_when_in_flight_limit_reached(pool):
+    assert pool.replay_slots.acquire(blocking=False)
+    try:
+        with pytest.raises(ReplayPoolSaturated):
+            PooledPokerService().validate_and_score(WARMUP_PAYLOAD)
+    finally:
+        pool.replay_slots.release()
+    assert PooledPokerService().validate_and_score(WARMUP_PAYLOAD)["board"]
+
+def test_timeout_returns_503_and_frees_slot_when_worker_finishes(pool, mock_repo, monkeypatch):
+    monkeypatch.setenv("REPLAY_TIMEOUT", "0.05")
+    # Pickled by reference, so the worker sleeps for `payload` seconds.
+    monkeypatch.setattr(pool, "_score_in_worker", time.sleep)
+
+    class SlowService:
+        def validate_and_score(self, payload): return pool.submit_replay(1.0)
+
+    app.dependency_overrides[get_poker_service] = lambda: SlowService()
+    app.dependency_overrides[get_hand_repository] = lambda: mock_repo
+    try:
+        # No lifespan, so the test's pool is the one requests use.
+        r = TestClient(app).post("/api/v1/hands/", json=VALID_HAND_PAYLOAD)
+    finally:
+        app.dependency_overrides.clear()
+    assert r.status_code == 503
+    assert "timed out" in r.text
+    assert r.headers["Retry-After"] == "1"
+
+    # The worker is still sleeping, so the only slot is still taken.
+    assert not pool.replay_slots.acquire(blocking=False)
+    assert pool.replay_slots.acquire(timeout=10)
+    pool.replay_slots.release()
+
+def test_broken_pool_returns_503_then_recovers(pool):
+    broken = pool.replay_pool
+    os.kill(pool.replay_worker_stats[0]["pid"], signal.SIGKILL)
+
+    with pytest.raises(ReplayPoolSaturated, match="restarting"):
+        PooledPokerService().validate_and_score(WARMUP_PAYLOAD)
+
+    deadline = time.monotonic() + 30
+    while pool.replay_pool is broken and time.monotonic() < deadline:
+        time.sleep(0.1)
+    assert pool.replay_pool is not broken
+    assert PooledPokerService().validate_and_score(WARMUP_PAYLOAD)["board"]
+
+def test_flood_past_cap_gets_503_before_touching_the_db(pool, mock_repo):
+    repo_requests = []
+
+    def counting_repo():
+        repo_requests.append(1)
+        return mock_repo
+
+    app.dependency_overrides[get_hand_repository] = counting_repo
+    client = TestClient(app)
+    held = pool.admit_replay()
+    try:
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            responses = list(executor.map(
+                lambda _: client.post("/api/v1/hands/", json=WARMUP_PAYLOAD), range(30)
+            ))
+        assert [r.status_code for r in responses] == [503] * 30
+        assert all(r.headers["Retry-After"] == "1" for r in responses)
+        assert repo_requests == []
+
+        held.release()
+        r = client.post("/api/v1/hands/", json=WARMUP_PAYLOAD)
+        assert r.status_code == 201, r.text
+        assert repo_requests == [1]
+    finally:
+        held.release()
+        app.dependency_overrides.clear()